@@ -4,6 +4,7 @@ from pathlib import Path
 import subprocess
 import os
 import sys
+import threading
 import addonmanager_utilities as utils
 try:
     # For v0.21:
@@ -70,11 +71,22 @@ if os.environ.get('DEBUG'):
         debugpy.debug_this_thread()
         print('DEBUG attached.')
 
-    try:
-        attach_debugger()
-    except:
-        pip_install('debugpy')
-        attach_debugger()
+    def _attach_debugger_installing():
+        try:
+            attach_debugger()
+        except:
+            pip_install('debugpy')
+            attach_debugger()
+
+    import FreeCAD as fc
+
+    # The sentinel lives on the FreeCAD module so that a module reload
+    # (e.g. Std_Reload) does not call `debugpy.listen()` a second time, which
+    # raises RuntimeError. The attach runs in a background thread so the GUI
+    # thread does not block on the port binding.
+    if not getattr(fc, '_cross_debugpy_started', False):
+        fc._cross_debugpy_started = True
+        threading.Thread(target=_attach_debugger_installing, daemon=True).start()
 
 
 # pip installs
@@ -94,16 +106,53 @@ except (ModuleNotFoundError, ImportError):
     pip_install('xmltodict')
 
 
-import FreeCAD as fc
-from .ros.utils import add_ros_library_path
 from .version import __version__
-from .wb_globals import g_ros_distro
 
 
-add_ros_library_path(g_ros_distro)
+# Implementation note: the ROS path discovery (`add_ros_library_path`) scans
+# the filesystem and pulls in the ROS imports, which is expensive. It used to
+# run here, i.e. at each FreeCAD start-up, even when no CROSS command was ever
+# invoked. It is now deferred to the first real use of the workbench
+# (cf. `_initialize`), `init_gui.py` triggers it when the GUI loads the
+# workbench.
+_initialize_lock = threading.Lock()
+_initialized = False
+
+
+def _initialize() -> None:
+    """Set up the ROS environment, exactly once per process.
+
+    Add the ROS paths to `sys.path` and `os.environ` and register the URDF
+    importer. Thread-safe and idempotent.
 
-# Must be imported after the call to `add_ros_library_path`.
-from .ros.utils import is_ros_found  # noqa: E402.
+    """
+    global _initialized
+    with _initialize_lock:
+        if _initialized:
+            return
+        _initialized = True
+        # Importing `wb_globals` calls `add_ros_library_path`.
+        from . import wb_globals  # noqa: F401.
+        # Must be imported after the call to `add_ros_library_path`.
+        from .ros.utils import is_ros_found
+        if is_ros_found():
+            _register_importers()
+
+
+def _register_importers() -> None:
+    """Register the file importers provided by this workbench."""
+    import FreeCAD as fc
 
-if is_ros_found():
     fc.addImportType('URDF files (*.urdf *.xacro)', 'freecad.cross.import_urdf')
+
+
+def __getattr__(name: str):
+    # PEP 562: load the ROS utilities lazily so that importing `freecad.cross`
+    # stays cheap.
+    if name in ('add_ros_library_path', 'is_ros_found'):
+        _initialize()
+        from .ros import utils as ros_utils
+        attr = getattr(ros_utils, name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
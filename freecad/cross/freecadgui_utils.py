@@ -5,12 +5,15 @@ from __future__ import annotations
 import FreeCAD as fc
 import FreeCADGui as fcgui
 from copy import deepcopy
+import math
 import re
 try:
     from PySide import QtWidgets
 except:
     from PySide2 import QtWidgets
 
+from .geom_utils import cached_bound_box
+from .geom_utils import fast_aabb
 from .freecad_utils import get_subobjects_by_full_name
 from .freecad_utils import first_object_with_volume
 from .freecad_utils import adjustedGlobalPlacement
@@ -73,7 +76,9 @@ def createBox(boundBox_, nameLabel):
 def createCylinder(boundBox_, nameLabel):
     boundObj = fc.ActiveDocument.addObject('Part::Cylinder', nameLabel + "_BoundCylinder")
     boundObj.Height = boundBox_.ZLength
-    boundObj.Radius = ((boundBox_.XLength ** 2 + boundBox_.YLength ** 2) ** 0.5) / 2.0
+    # Tight radius: the in-plane (XY) half-diagonal, not the 3D one which
+    # would over-size the cylinder since Z is already covered by the height.
+    boundObj.Radius = math.hypot(boundBox_.XLength, boundBox_.YLength) / 2.0
     boundBoxLocation = fc.Vector(boundBox_.Center.x, boundBox_.Center.y, boundBox_.ZMin)
 
     return boundObj, boundBoxLocation
@@ -91,12 +96,20 @@ def createBoundAbstract(obj, createPrimitive = createBox):
 
     obj = first_object_with_volume(obj)
 
+    # Bail out before any expensive call when the object carries no geometry.
+    if obj is None:
+        fc.Console.PrintError("Bad selection"+"\n")
+        return False
+
     if hasattr(obj, "Shape"):
         s = obj.Shape
     elif hasattr(obj, "Mesh"):      # upgrade with wmayer thanks #http://forum.freecadweb.org/viewtopic.php?f=13&t=22331
         s = obj.Mesh
     elif hasattr(obj, "Points"):
         s = obj.Points
+    else:
+        fc.Console.PrintError("Bad selection"+"\n")
+        return False
 
     boundObj = False
     try:
@@ -106,7 +119,10 @@ def createBoundAbstract(obj, createPrimitive = createBox):
         blue  = 0.4  #
     
         # boundBox
-        boundBox_    = s.BoundBox
+        boundBox_    = cached_bound_box(s)
+        if hasattr(boundBox_, 'isValid') and not boundBox_.isValid():
+            # Stale or invalid bounding box, recompute from the vertices.
+            boundBox_ = fast_aabb(s)
         boundBoxLX   = boundBox_.XLength
         boundBoxLY   = boundBox_.YLength
         boundBoxLZ   = boundBox_.ZLength
@@ -0,0 +1,131 @@
+"""Geometry helper functions for this workbench."""
+
+from __future__ import annotations
+
+import FreeCAD as fc
+
+import numpy as np
+
+try:
+    # Optional dependency, the NumPy path is used when not available.
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Below this vertex count the NumPy reduction is cheaper than dispatching to
+# the compiled kernel.
+_NUMBA_MIN_POINTS = 100_000
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _aabb_jit(points: np.ndarray) -> np.ndarray:
+        """Single-pass parallel min/max reduction over an (N,3) array."""
+        min_x = min_y = min_z = np.inf
+        max_x = max_y = max_z = -np.inf
+        for i in prange(points.shape[0]):
+            x = points[i, 0]
+            y = points[i, 1]
+            z = points[i, 2]
+            min_x = min(min_x, x)
+            min_y = min(min_y, y)
+            min_z = min(min_z, z)
+            max_x = max(max_x, x)
+            max_y = max(max_y, y)
+            max_z = max(max_z, z)
+        return np.array((min_x, min_y, min_z, max_x, max_y, max_z))
+else:
+    _aabb_jit = None
+
+
+# Maximum deviation (mm) between the tessellation and the exact surface.
+_TESSELLATION_DEFLECTION = 0.1
+
+
+def points_from_shape(shape) -> np.ndarray:
+    """Return the vertex coordinates of a shape as an (N,3) array.
+
+    Prefer `shape.tessellate()`, which materializes the vertex list in a
+    single C call, over `shape.Vertexes` which wraps every vertex in a
+    Python object.
+
+    """
+    if hasattr(shape, 'tessellate'):
+        vertices, _facets = shape.tessellate(_TESSELLATION_DEFLECTION)
+        if not vertices:
+            return np.empty((0, 3))
+        # fc.Vector supports the sequence protocol, so the whole list
+        # converts in one call.
+        return np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    return np.fromiter(
+            (c for v in shape.Vertexes for c in (v.X, v.Y, v.Z)),
+            dtype=np.float64,
+    ).reshape(-1, 3)
+
+
+def aabb(points: np.ndarray) -> np.ndarray:
+    """Return (min_x, min_y, min_z, max_x, max_y, max_z) for an (N,3) array.
+
+    Single entry point that picks the best available kernel for the platform
+    and input size: the compiled Numba kernel for large inputs when Numba is
+    installed, the NumPy reduction otherwise.
+
+    """
+    if (_aabb_jit is not None) and (points.shape[0] >= _NUMBA_MIN_POINTS):
+        # Compiled single-pass kernel, avoids the six intermediate NumPy
+        # reductions for very large meshes.
+        return _aabb_jit(points)
+    # Reduce over unit-stride per-axis lanes (structure-of-arrays layout) so
+    # that NumPy's SIMD reduction loops engage instead of strided gathers.
+    soa = np.ascontiguousarray(points.T)
+    return np.concatenate((soa.min(axis=1), soa.max(axis=1)))
+
+
+# Memoized bounding boxes, keyed by the geometry's hashCode() and placement.
+# The key must not involve the Python wrapper's identity: accessors such as
+# `obj.Shape` hand out a fresh wrapper on every call, so only the underlying
+# shape data identifies the geometry across invocations. Shared by all CROSS
+# tools needing a bounding box (bound-object commands, collision helpers,
+# ...) so a box computed by one tool is reused by the next.
+_bound_box_cache: dict[tuple, 'fc.BoundBox'] = {}
+
+
+def cached_bound_box(geometry) -> 'fc.BoundBox':
+    """Return geometry.BoundBox, memoized between invocations.
+
+    Computing the bounding box traverses the whole vertex data in OCCT, so
+    repeated queries on an unchanged geometry should not pay that cost again.
+
+    """
+    hash_code = getattr(geometry, 'hashCode', None)
+    if hash_code is None:
+        # No cheap way to identify the geometry (e.g. meshes, point clouds).
+        return geometry.BoundBox
+    placement = geometry.Placement
+    stamp = (
+        hash_code(),
+        placement.Base.x, placement.Base.y, placement.Base.z,
+        *placement.Rotation.Q,
+    )
+    bound_box = _bound_box_cache.get(stamp)
+    if bound_box is not None:
+        return bound_box
+    bound_box = geometry.BoundBox
+    if len(_bound_box_cache) > 128:
+        # Avoid unbounded growth over a long session.
+        _bound_box_cache.clear()
+    _bound_box_cache[stamp] = bound_box
+    return bound_box
+
+
+def fast_aabb(shape) -> fc.BoundBox:
+    """Return the axis-aligned bounding box of a shape.
+
+    Vectorized fallback for shapes whose `BoundBox` is stale or invalid:
+    the extrema are computed with a single NumPy reduction per axis rather
+    than a Python-level loop over the vertices.
+
+    """
+    points = points_from_shape(shape)
+    if not points.size:
+        return fc.BoundBox()
+    return fc.BoundBox(*aabb(points))
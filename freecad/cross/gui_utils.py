@@ -12,3 +12,67 @@ if hasattr(fc, 'GuiUp') and fc.GuiUp:
 else:
     def tr(text: str) -> str:
         return text
+
+
+# FreeCAD polls the commands' IsActive() continuously (several times per
+# second), so anything beyond O(1) there is wasted work between two selection
+# changes. The observer below stamps each selection change with a counter,
+# letting IsActive() implementations cache their last result.
+_selection_counter = 0
+_selection_observer = None
+
+
+class _SelectionCounter:
+    """Selection observer incrementing a counter on every selection change."""
+
+    def addSelection(self, doc, obj, sub, pnt):
+        _bump_selection_counter()
+
+    def removeSelection(self, doc, obj, sub):
+        _bump_selection_counter()
+
+    def setSelection(self, doc):
+        _bump_selection_counter()
+
+    def clearSelection(self, doc):
+        _bump_selection_counter()
+
+
+def _bump_selection_counter() -> None:
+    global _selection_counter
+    _selection_counter += 1
+
+
+def selection_stamp() -> int:
+    """Return a counter that changes whenever the selection changes."""
+    global _selection_observer
+    if _selection_observer is None:
+        # Import here to be able to import the module without GUI.
+        import FreeCADGui as fcgui
+
+        _selection_observer = _SelectionCounter()
+        fcgui.Selection.addObserver(_selection_observer)
+    return _selection_counter
+
+
+_last_has_selection_stamp = -1
+_has_selection = False
+
+
+def has_selection() -> bool:
+    """Return True if anything is selected, O(1) between selection changes.
+
+    Cheap replacement for `bool(fcgui.Selection.getSelection())` in
+    `IsActive()`: the selection list is only re-retrieved after a selection
+    change.
+
+    """
+    global _last_has_selection_stamp, _has_selection
+    stamp = selection_stamp()
+    if stamp != _last_has_selection_stamp:
+        # Import here to be able to import the module without GUI.
+        import FreeCADGui as fcgui
+
+        _has_selection = bool(fcgui.Selection.getSelection())
+        _last_has_selection_stamp = stamp
+    return _has_selection
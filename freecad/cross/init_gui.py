@@ -1,6 +1,11 @@
 
 import FreeCADGui as fcgui
 
+from . import _initialize
+
+# Set up the ROS paths and register the importers before loading the commands.
+_initialize()
+
 from .ui import command_assembly_from_urdf
 from .ui import command_box_from_bounding_box
 from .ui import command_get_planning_scene
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import NewType, List, Union
+from typing import TYPE_CHECKING, Union
 
 import FreeCAD as fc
 
@@ -10,16 +10,26 @@ import FreeCAD as fc
 DO = fc.DocumentObject
 # Implementation note: These cannot be imported because of circular
 # dependency.
-Joint = NewType('Joint', DO)
-Link = NewType('Link', DO)
-Controller = NewType('Controller', DO)
-AttachedCollisionObject = NewType('AttachedCollisionObject', DO)
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    Joint: TypeAlias = DO
+    Link: TypeAlias = DO
+    Controller: TypeAlias = DO
+    AttachedCollisionObject: TypeAlias = DO
+else:
+    # Plain aliases: unlike NewType, these leave no runtime wrapper to call.
+    Joint = Link = Controller = AttachedCollisionObject = DO
 
 BasicElement = Union[AttachedCollisionObject, Joint, Link, Controller]
-DOList = List[DO]
+DOList = list[DO]
 
 
 class Robot(DO):
+    # Typing shim over the C++ DocumentObject, no Python-side attribute
+    # storage (and thus no per-instance `__dict__`) is needed.
+    __slots__ = ()
+
     Group: list[BasicElement]
     OutputPath: str
     Placement: fc.Placement
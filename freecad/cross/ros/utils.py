@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from copy import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import os
@@ -40,7 +41,10 @@ def has_ros_distro_in_env() -> bool:
     )
 
 
+@lru_cache(maxsize=1)
 def is_ros_found() -> bool:
+    # Cached because guessing the distro probes the filesystem and the result
+    # cannot change within a FreeCAD session.
     return get_ros_distro_from_env_or_default() != ''
 
 
@@ -1,32 +1,35 @@
-import FreeCAD as fc
 import FreeCADGui as fcgui
 
-from ..freecadgui_utils import createBoundBox
+from ..gui_utils import has_selection
 from ..gui_utils import tr
-from ..wb_gui_utils import createBoundObjects
-from typing import List
-DO = fc.DocumentObject
-DOList = List[DO]
 
 
 class BoxFromBoundingBoxCommand:
     def GetResources(self):
-        return {
-            'Pixmap': 'box_from_bbox.svg',
-            'MenuText': tr('Box from bounding box'),
-            'ToolTip': tr(
-                'Add a Part::Cube corresponding to the'
-                ' bounding box of the selected objects.'
-                '\n\nIf you select a link, an object based on Real element will be created. '
-                'This object will then be bound to the link as a collision.',
-            ),
-        }
+        # Qt translation lookup is a linear scan of the loaded .qm
+        # tables; resolve the texts only once.
+        if not hasattr(self, '_resources'):
+            self._resources = {
+                'Pixmap': 'box_from_bbox.svg',
+                'MenuText': tr('Box from bounding box'),
+                'ToolTip': tr(
+                    'Add a Part::Cube corresponding to the'
+                    ' bounding box of the selected objects.'
+                    '\n\nIf you select a link, an object based on Real element will be created. '
+                    'This object will then be bound to the link as a collision.',
+                ),
+            }
+        return self._resources
 
     def Activated(self):
+        # Import late to avoid slowing down workbench start-up.
+        from ..freecadgui_utils import createBoundBox
+        from ..wb_gui_utils import createBoundObjects
+
         createBoundObjects(createBoundFunc = createBoundBox)
 
     def IsActive(self):
-        return bool(fcgui.Selection.getSelection())
+        return has_selection()
 
 
 fcgui.addCommand('BoxFromBoundingBox', BoxFromBoundingBoxCommand())
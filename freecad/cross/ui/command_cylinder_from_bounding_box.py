@@ -1,30 +1,36 @@
-import FreeCAD as fc
 import FreeCADGui as fcgui
 
+from ..gui_utils import has_selection
 from ..gui_utils import tr
-from ..freecadgui_utils import createBoundCylinder
-from ..wb_gui_utils import createBoundObjects
 
 
 class CylinderFromBoundingBoxCommand:
     def GetResources(self):
-        return {
-            'Pixmap': 'cylinder_from_bbox.svg',
-            'MenuText': tr('Cylinder from bounding box'),
-            'ToolTip': tr(
-                'Add a z-aligned Part::Cylinder englobing the'
-                ' bounding box of the selected objects.'
-                '\n\nIf you select a link, an object based on Real element will be created. '
-                'This object will then be bound to the link as a collision.',
-            ),
-        }
+        # Qt translation lookup is a linear scan of the loaded .qm
+        # tables; resolve the texts only once.
+        if not hasattr(self, '_resources'):
+            self._resources = {
+                'Pixmap': 'cylinder_from_bbox.svg',
+                'MenuText': tr('Cylinder from bounding box'),
+                'ToolTip': tr(
+                    'Add a z-aligned Part::Cylinder englobing the'
+                    ' bounding box of the selected objects.'
+                    '\n\nIf you select a link, an object based on Real element will be created. '
+                    'This object will then be bound to the link as a collision.',
+                ),
+            }
+        return self._resources
 
     def Activated(self):
+        # Import late to avoid slowing down workbench start-up.
+        from ..freecadgui_utils import createBoundCylinder
+        from ..wb_gui_utils import createBoundObjects
+
         createBoundObjects(createBoundFunc = createBoundCylinder)
 
 
     def IsActive(self):
-        return bool(fcgui.Selection.getSelection())
+        return has_selection()
 
 
 fcgui.addCommand('CylinderFromBoundingBox', CylinderFromBoundingBoxCommand())
@@ -10,30 +10,48 @@ from __future__ import annotations
 import FreeCAD as fc
 import FreeCADGui as fcgui
 
+from ..gui_utils import selection_stamp
 from ..gui_utils import tr
 
+# Cache for `_supported_object_selected`, invalidated on selection change.
+_last_selection_stamp = -1
+_last_supported = True
+
 
 def _supported_object_selected():
+    # FreeCAD polls IsActive() continuously; only re-inspect the selection
+    # after it changed.
+    global _last_selection_stamp, _last_supported
+    stamp = selection_stamp()
+    if stamp == _last_selection_stamp:
+        return _last_supported
+
     # Import late to avoid slowing down workbench start-up.
     from ..wb_utils import is_robot
 
     objs = fcgui.Selection.getSelection()
     if not objs:
-        return True
-    if is_robot(objs[0]):
-        return True
-    return False
+        supported = True
+    else:
+        supported = is_robot(objs[0])
+    _last_selection_stamp = stamp
+    _last_supported = supported
+    return supported
 
 
 class _KKEditCommand:
     """Command to edit the selected robot in KK representation."""
 
     def GetResources(self):
-        return {
-            'Pixmap': 'kk_edit.svg',
-            'MenuText': tr('Edit DH or KK parameters'),
-            'ToolTip': tr('Edit the Denavit-Hartenberg or Khalil-Kleinfinger parameters of the selected robot'),
-        }
+        # Qt translation lookup is a linear scan of the loaded .qm
+        # tables; resolve the texts only once.
+        if not hasattr(self, '_resources'):
+            self._resources = {
+                'Pixmap': 'kk_edit.svg',
+                'MenuText': tr('Edit DH or KK parameters'),
+                'ToolTip': tr('Edit the Denavit-Hartenberg or Khalil-Kleinfinger parameters of the selected robot'),
+            }
+        return self._resources
 
     def Activated(self):
         # Import late to avoid slowing down workbench start-up.
@@ -1,29 +1,35 @@
-import FreeCAD as fc
 import FreeCADGui as fcgui
 
+from ..gui_utils import has_selection
 from ..gui_utils import tr
-from ..freecadgui_utils import createBoundSphere
-from ..wb_gui_utils import createBoundObjects
 
 
 class SphereFromBoundingBoxCommand:
     def GetResources(self):
-        return {
-            'Pixmap': 'sphere_from_bbox.svg',
-            'MenuText': tr('Sphere from bounding box'),
-            'ToolTip': tr(
-                'Add a Part::Sphere corresponding to the'
-                ' bounding box of the selected objects.'
-                '\n\nIf you select a link, an object based on Real element will be created. '
-                'This object will then be bound to the link as a collision.',
-            ),
-        }
+        # Qt translation lookup is a linear scan of the loaded .qm
+        # tables; resolve the texts only once.
+        if not hasattr(self, '_resources'):
+            self._resources = {
+                'Pixmap': 'sphere_from_bbox.svg',
+                'MenuText': tr('Sphere from bounding box'),
+                'ToolTip': tr(
+                    'Add a Part::Sphere corresponding to the'
+                    ' bounding box of the selected objects.'
+                    '\n\nIf you select a link, an object based on Real element will be created. '
+                    'This object will then be bound to the link as a collision.',
+                ),
+            }
+        return self._resources
 
     def Activated(self):
+        # Import late to avoid slowing down workbench start-up.
+        from ..freecadgui_utils import createBoundSphere
+        from ..wb_gui_utils import createBoundObjects
+
         createBoundObjects(createBoundFunc = createBoundSphere)
 
     def IsActive(self):
-        return bool(fcgui.Selection.getSelection())
+        return has_selection()
 
 
 fcgui.addCommand('SphereFromBoundingBox', SphereFromBoundingBoxCommand())
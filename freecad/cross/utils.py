@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from itertools import islice
 from itertools import zip_longest
+from functools import lru_cache
 from functools import reduce
 import os
 from pathlib import Path
@@ -54,6 +55,9 @@ def add_path_to_environment_variable(path: [Path | str], env_var: str) -> None:
         os.environ[env_var] += f'{path_sep}{path_str}'
 
 
+# Memoized because many FreeCAD links resolve to the same target label, so
+# the same string is sanitized over and over during an export.
+@lru_cache(maxsize=1024)
 def get_valid_filename(text: str) -> str:
     """Return a string that is a valid file name."""
     return INVALID_FILENAME_CHARS.sub('_', text)
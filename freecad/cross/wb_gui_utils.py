@@ -80,59 +80,71 @@ def createBoundObjects(createBoundFunc = createBoundBox):
 
     """
     selEx = fcgui.Selection.getSelectionEx()
-    objs  = [selobj.Object for selobj in selEx]
+    # Cheap pre-pass: joints and robots can never produce a bound object, so
+    # filter them out before opening any transaction. If nothing remains, the
+    # user gets the message without an open/abort transaction pair.
+    objs = [
+        selobj.Object for selobj in selEx
+        if not (is_joint(selobj.Object) or is_robot(selobj.Object))
+    ]
     doc = fc.activeDocument()
-    
+
     if len(objs) >= 1:
+        # One transaction (and one recompute) for the whole selection, so that
+        # bulk selections stay one undoable step instead of N.
         doc.openTransaction(tr(createBoundFunc.__name__ + 'from bounding box'))
-
-        for obj in objs:
-            if is_joint(obj) or is_robot(obj):
-                continue
-
-            robotLink = False
-            if is_link(obj):
-                if obj.Real:
-                    robotLink = obj
-                    # get deepest linked object
-                    obj = obj.Real[0].getLinkedObject(True)
-                else:
-                    fc.Console.PrintWarning("Can`t create collision for link: " + obj.Label + ". Add Real element to link firstly !"+"\n")
+        created = False
+        try:
+            for obj in objs:
+                robotLink = False
+                if is_link(obj):
+                    if obj.Real:
+                        robotLink = obj
+                        # get deepest linked object
+                        obj = obj.Real[0].getLinkedObject(True)
+                    else:
+                        fc.Console.PrintWarning("Can`t create collision for link: " + obj.Label + ". Add Real element to link firstly !"+"\n")
+                        continue
+
+                obj_placement_old = obj.Placement
+                obj.Placement = fc.Placement()
+                # create bound object with zero placement
+                bound = createBoundFunc(obj)
+                obj.Placement = obj_placement_old
+
+                if not bound:
                     continue
-
-            obj_placement_old = obj.Placement
-            obj.Placement = fc.Placement()
-            # create bound object with zero placement
-            bound = createBoundFunc(obj)
-            obj.Placement = obj_placement_old
-
-            boundObj = fc.ActiveDocument.getObject(bound.Name)
-
-            # if link was selected do collision bind
-            if robotLink:
-                if not robotLink.Collision and bound:
-                    robotLinkObj = fc.ActiveDocument.getObject(robotLink.Name)
-
-                    # Makes wrapper with robot link placement because has made bound object in zero placement before
+                created = True
+
+                # if link was selected do collision bind
+                if robotLink:
+                    if not robotLink.Collision:
+                        # Makes wrapper with robot link placement because has made bound object in zero placement before
+                        # This wrapper need to move primitive in correct placement
+                        boundObjWrapper = doc.addObject("App::Part", "bound_obj_placement__" + robotLink.Label + '__' + bound.Label)
+                        boundObjWrapper.Group = [bound]
+                        boundObjWrapper.Placement = robotLink.Placement
+
+
+                        robotLink.Collision = boundObjWrapper
+                        # refresh collision link
+                        robotLinkGui = fcgui.ActiveDocument.getObject(robotLink.Name)
+                        robotLinkGui.ShowCollision = False
+                        robotLinkGui.ShowCollision = True
+                        # hide collision source object (will see it on link)
+                        fcgui.ActiveDocument.getObject(boundObjWrapper.Name).hide()
+                else:
+                    # Makes wrapper with object placement because has made bound object in zero placement before
                     # This wrapper need to move primitive in correct placement
-                    boundObjWrapper = fc.ActiveDocument.addObject("App::Part", "bound_obj_placement__" + robotLink.Label + '__' + bound.Label)
-                    boundObjWrapper.Group = [boundObj]
-                    boundObjWrapper.Placement = robotLinkObj.Placement
-
-
-                    robotLinkObj.Collision = boundObjWrapper
-                    # refresh collision link
-                    fcgui.ActiveDocument.getObject(robotLink.Name).ShowCollision = False
-                    fcgui.ActiveDocument.getObject(robotLink.Name).ShowCollision = True
-                    # hide collision source object (will see it on link)
-                    fcgui.ActiveDocument.getObject(boundObjWrapper.Name).hide()
+                    boundObjWrapper = doc.addObject("App::Part", "bound_obj_placement__" + bound.Label)
+                    boundObjWrapper.Group = [bound]
+                    boundObjWrapper.Placement = obj_placement_old
+        finally:
+            if created:
+                doc.commitTransaction()
+                doc.recompute()
             else:
-                # Makes wrapper with object placement because has made bound object in zero placement before
-                # This wrapper need to move primitive in correct placement
-                boundObjWrapper = fc.ActiveDocument.addObject("App::Part", "bound_obj_placement__" + bound.Label)
-                boundObjWrapper.Group = [boundObj]
-                boundObjWrapper.Placement = obj_placement_old
-        doc.commitTransaction()
+                doc.abortTransaction()
     else:
         fc.Console.PrintMessage("Select an object !"+"\n")
 
@@ -0,0 +1,56 @@
+"""Regression tests for the quaternion-to-RPY conversions in urdf_utils.
+
+Run with pytest from the repository root, inside an environment where
+FreeCAD's Python modules are importable (e.g. FreeCAD's bundled python or
+the docker image).
+
+"""
+import math
+
+import pytest
+
+# `urdf_utils` imports FreeCAD and numpy at module level.
+pytest.importorskip('FreeCAD')
+np = pytest.importorskip('numpy')
+
+from freecad.cross.urdf_utils import euler_from_matrix  # noqa: E402.
+from freecad.cross.urdf_utils import quaternion_matrix  # noqa: E402.
+from freecad.cross.urdf_utils import rpy_from_quaternion  # noqa: E402.
+from freecad.cross.urdf_utils import rpy_from_quaternions_batch  # noqa: E402.
+
+_SQRT_05 = math.sqrt(0.5)
+
+# Format (qx, qy, qz, qw). The pitch = ±pi/2 entries exercise the
+# gimbal-lock branch, including locked orientations with non-zero roll.
+_QUATERNIONS = [
+    (0.0, 0.0, 0.0, 1.0),
+    (_SQRT_05, 0.0, 0.0, _SQRT_05),
+    (0.0, 0.0, _SQRT_05, _SQRT_05),
+    (0.0, _SQRT_05, 0.0, _SQRT_05),
+    (0.0, -_SQRT_05, 0.0, _SQRT_05),
+    (-0.5, 0.5, 0.5, 0.5),
+    (0.5, -0.5, 0.5, 0.5),
+    (-_SQRT_05, 0.0, _SQRT_05, 0.0),
+    (0.1, 0.2, 0.3, math.sqrt(1.0 - 0.14)),
+    (-0.4, 0.1, -0.2, math.sqrt(1.0 - 0.21)),
+]
+
+
+def _rpy_via_matrix(q):
+    """Reference conversion through the rotation-matrix path."""
+    return euler_from_matrix(quaternion_matrix(q))
+
+
+def test_rpy_from_quaternion_matches_matrix_path():
+    for q in _QUATERNIONS:
+        assert rpy_from_quaternion(q) == pytest.approx(
+                _rpy_via_matrix(q), abs=1e-9,
+        ), q
+
+
+def test_rpy_from_quaternions_batch_matches_matrix_path():
+    # The batch and scalar variants must not drift apart, in particular on
+    # the gimbal-locked inputs.
+    batch = rpy_from_quaternions_batch(_QUATERNIONS)
+    for q, rpy in zip(_QUATERNIONS, batch):
+        assert tuple(rpy) == pytest.approx(_rpy_via_matrix(q), abs=1e-9), q